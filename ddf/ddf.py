@@ -5,11 +5,12 @@
 # License: MIT
 
 import os
+import ast
+import copy
+import stat
 import sys
 import traceback
-from rich.console import Console
-from rich.syntax import Syntax
-from rich.table import Table
+from rich.console import Console, Group
 console = Console()
 
 if len(sys.argv) > 1 and any('--debug' == arg for arg in sys.argv):
@@ -65,71 +66,83 @@ def print_error(e=None, message = None):
 
 import atexit
 from enum import Enum
-import weakref
-import redis
 import yaml
+# use the libyaml C loader when PyYAML was built with it; writes stay on the pure-Python dumper,
+# CSafeDumper escapes non-BMP characters (emoji) and dumping a compose file is cheap anyway
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = yaml.SafeDumper
 from dataclasses import dataclass
 import argparse
-try:
-    from pydebugger.debug import debug
-except:
+# --debug sets DEBUG, which is also what pydebugger reads
+if any(str(os.getenv(var, '0')).lower() in ['1', 'yes', 'true'] for var in ('DEBUG', 'DDF_DEBUG')):
+    try:
+        from pydebugger.debug import debug
+    except ImportError:
+        def debug(*args, **kwargs):
+            return
+else:
     def debug(*args, **kwargs):
-        return 
+        return
 import hashlib
 from configset import configset
 from rich_argparse import RichHelpFormatter, _lazy_rich as rr
 from typing import ClassVar, Optional, Any, Callable
 import functools
-from rich import box
 from typing import List
 import fnmatch
 import subprocess
 from pathlib import Path
 import shutil
-import clipboard
 import tempfile
-import shlex
 import re
 # from contextlib import contextmanager
-# import importlib
-import importlib.util
 import datetime
 
-from gntplib import Publisher
-
 import time
 import threading
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
 import socket
 import json
-
-_SERVER_MODE_AVAILABLE = False
-try:
-    from pystray import Icon, Menu, MenuItem
-    from PIL import Image, ImageDraw
-    import plyer
-    _SERVER_MODE_AVAILABLE = True
-except ImportError:
-    console.print("[bold red]⚠️ Server mode requires: pystray, Pillow, plyer. Install with:[/]")
-    console.print("    pip install pystray Pillow plyer")
-    # sys.exit(1)
+from collections import OrderedDict
 
 CONFIGFILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'ddf.ini')
 CONFIG = configset(CONFIGFILE)
+_config_cache = {}
+
+def _config_memo(key, compute):
+    """
+    Return compute() memoized under key until the mtime of ddf.ini changes.
+    """
+    try:
+        mtime = os.stat(CONFIGFILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _config_cache.get('__mtime__') != mtime:
+        _config_cache.clear()
+        _config_cache['__mtime__'] = mtime
+    if key not in _config_cache:
+        _config_cache[key] = compute()
+    return _config_cache[key]
+
+def _config(section, option, default=None):
+    """
+    Memoized CONFIG.get_config(), configset re-reads and re-hashes ddf.ini on every lookup.
+    The cached values are dropped as soon as the mtime of ddf.ini changes.
+    """
+    return _config_memo((section, option, default), lambda: CONFIG.get_config(section, option, default))
 
-if CONFIG.get_config('docker', 'host'):
-    os.environ['DOCKER_HOST'] = CONFIG.get_config('docker', 'host')
+if _config('docker', 'host'):
+    os.environ['DOCKER_HOST'] = _config('docker', 'host')
     if not ":" in os.environ['DOCKER_HOST']:
         # If no port is specified, default to 2375 for TCP or 2376 for TLS
-        os.environ['DOCKER_HOST'] += ':' + CONFIG.get_config('docker', 'port', '2375') if not CONFIG.get_config('docker', 'tls_verify') else ':' + CONFIG.get_config('docker', 'tls_port', '2376')
-if CONFIG.get_config('docker', 'tls_verify'):
-    os.environ['DOCKER_TLS_VERIFY'] = CONFIG.get_config('docker', 'tls_verify')
-if CONFIG.get_config('docker', 'cert_path'):
-    os.environ['DOCKER_CERT_PATH'] = CONFIG.get_config('docker', 'cert_path')
-if CONFIG.get_config('docker', 'api_version'):
-    os.environ['DOCKER_API_VERSION'] = CONFIG.get_config('docker', 'api_version')
+        os.environ['DOCKER_HOST'] += ':' + _config('docker', 'port', '2375') if not _config('docker', 'tls_verify') else ':' + _config('docker', 'tls_port', '2376')
+if _config('docker', 'tls_verify'):
+    os.environ['DOCKER_TLS_VERIFY'] = _config('docker', 'tls_verify')
+if _config('docker', 'cert_path'):
+    os.environ['DOCKER_CERT_PATH'] = _config('docker', 'cert_path')
+if _config('docker', 'api_version'):
+    os.environ['DOCKER_API_VERSION'] = _config('docker', 'api_version')
 
 # ================================ #
 # SERVER MODE + TRAY ICON SUPPORT  #
@@ -151,9 +164,9 @@ def is_server_running():
             pass
     return False
 
-SERVER_HOST = CONFIG.get_config('server', 'host', default='127.0.0.1')
-SERVER_PORT = int(CONFIG.get_config('server', 'port', default='9876'))
-SERVER_ACTIVE = str(CONFIG.get_config('server', 'active', default='false')).lower() in ('1', 'true', 'yes') or is_server_running()
+SERVER_HOST = _config('server', 'host', default='127.0.0.1')
+SERVER_PORT = int(_config('server', 'port', default='9876'))
+SERVER_ACTIVE = str(_config('server', 'active', default='false')).lower() in ('1', 'true', 'yes') or is_server_running()
 
 _imports = {}
 
@@ -179,9 +192,13 @@ def lazy_import(module_name, attr=None):
     
     return _imports[cache_key]
 
+def Syntax(*args, **kwargs):
+    # rich.syntax pulls in pygments, only pay for it when something is highlighted
+    return lazy_import('rich.syntax', 'Syntax')(*args, **kwargs)
+
 def create_emoji_icon(emoji="🐳"):
-    img = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    img = lazy_import('PIL.Image').new("RGBA", (64, 64), (0, 0, 0, 0))
+    draw = lazy_import('PIL.ImageDraw').Draw(img)
     draw.ellipse((0, 0, 64, 64), fill=(0, 150, 255))
     return img
 
@@ -189,12 +206,13 @@ def notify_user(title, message, level="info"):
     try:
         if hasattr(notify_user, 'icon') and notify_user.icon:
             notify_user.icon.notify(message, title)
-        plyer.notification.notify(title=title, message=message[:200], app_name="ddf", timeout=5)
+        lazy_import('plyer').notification.notify(title=title, message=message[:200], app_name="ddf", timeout=5)
     except:
         pass
 
     try:
         icon = Path(__file__).parent / 'ddf.png' if (Path(__file__).parent / 'ddf.png').is_file() else None
+        Publisher = lazy_import('gntplib', 'Publisher')
         p = Publisher("DDF", ['info', 'success', 'error', 'warning', 'notice', 'alert', 'emergency', 'debug', 'critical'], icon)
         try:
             p.register()
@@ -238,6 +256,105 @@ def validate_service_name(service_name):
     
     return service_name
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern):
+    """
+    Return a matcher for a service pattern (wildcard or substring), compiled once per pattern.
+    """
+    # fnmatch.fnmatch is case-insensitive where the OS paths are
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    if not any(c in pattern for c in '*?['):
+        # without wildcards the glob can only add an exact (case-folded) match to the substring test
+        if not flags:
+            return lambda name: pattern in name
+        folded = pattern.lower()
+        return lambda name: pattern in name or name.lower() == folded
+    glob = re.compile(fnmatch.translate(pattern), flags).match
+    return lambda name: glob(name) is not None or pattern in name
+
+# Dockerfile instructions used to locate the entrypoint script
+_ENTRYPOINT_RE = re.compile(r'^\s*ENTRYPOINT\s+(.+)$', re.IGNORECASE)
+_COPY_RE = re.compile(r'^\s*COPY\s+(?:--\S+\s+)*(\S+)(?:\s+\S+)*?\s+(\S+)\s*$', re.IGNORECASE)
+
+# the top level `services:` key of a compose file
+_SERVICES_KEY_RE = re.compile(r'^services\s*:\s*(#.*)?$')
+
+def _read_text(path):
+    """
+    Read a text file as UTF-8 regardless of the locale, replacing undecodable bytes.
+    """
+    return Path(path).read_bytes().decode('utf-8', errors='replace')
+
+def _atomic_write(path, data, mode=None):
+    """
+    Write str (as UTF-8 text) or bytes to path through a temporary file and os.replace(),
+    so an interrupted write never leaves a truncated file. Symlinks are followed and the file mode is kept;
+    a new file gets `mode`, or the usual umask default when it is None.
+    """
+    path = os.path.realpath(path)
+    # mkstemp opens with O_EXCL under an unpredictable name, so a planted file or symlink is never written through
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with (os.fdopen(fd, 'wb') if isinstance(data, bytes) else os.fdopen(fd, 'w', encoding='utf-8')) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            if mode is None:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            os.chmod(tmp, mode)
+        except OSError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def _private_cache_dir():
+    """
+    Return ddf's per-user cache directory, created with mode 0700.
+    Returns None when it exists but is not a directory owned by the current user.
+    """
+    if sys.platform == 'win32':
+        base = os.getenv('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+        path = Path(base) / 'ddf' / 'cache'
+    else:
+        path = Path(os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')) / 'ddf'
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if sys.platform != 'win32':
+            st = os.lstat(path)
+            if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+                return None
+            if st.st_mode & 0o077:
+                os.chmod(path, 0o700)
+    except OSError:
+        return None
+    return path
+
+def _is_plain_data(value):
+    """True when value is made of dicts with str keys, lists, str, int, float, bool and None only."""
+    if value is None or isinstance(value, (str, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_plain_data(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain_data(v) for k, v in value.items())
+    return False
+
+# "[ip:]host[/proto]:container[/proto]" compose port mapping
+_PORT_RE = re.compile(
+    r'^(?P<host>(?:(?P<ip>[^:]+):)?(?P<hp>[^:/]+)(?P<hproto>/\w+)?)'
+    r':(?P<container>(?P<cp>[^:/]+)(?P<cproto>/\w+)?)$'
+)
+
 def safe_subprocess_run(command_list, **kwargs):
     """Safely run subprocess with validation."""
     if not isinstance(command_list, list):
@@ -332,25 +449,37 @@ class CacheConfig:
     redis_password: str = None  # Changed from hardcoded password
     redis_db: int = 0
     pickle_dir: str = "/tmp/docker_cache" if not sys.platform == 'win32' else r"C:\TEMP\docker_cache"
+    hash_algo: str = "blake2b"
     
     def __post_init__(self):
         if self.memcached_servers is None:
             self.memcached_servers = [('localhost', 11211)]  # Changed
         
+        # configset converts "true"/"false" to bool, the default stays a str
+        enabled = _config('cache', 'enabled', 'true')
+        self.enabled = enabled if isinstance(enabled, bool) else str(enabled).strip().lower() in ('1', 'true', 'yes', 'on')
+
+        # read on its own so a bad value elsewhere in [cache] can't leave it at the default
+        hash_algo = str(_config('cache', 'hash_algo', 'blake2b') or 'blake2b').strip().lower()
+        # shake_* digests need a length and can't be used by write_hash
+        if hash_algo in hashlib.algorithms_available and not hash_algo.startswith('shake'):
+            self.hash_algo = hash_algo
+        else:
+            logger.warning(f"Unknown cache hash_algo '{hash_algo}', using blake2b")
+
         # Read from config or environment
         try:
-            self.backend = CacheBackend(CONFIG.get_config('cache', 'backend', 'redis'))
-            self.ttl = int(CONFIG.get_config('cache', 'ttl')) if CONFIG.get_config('cache', 'ttl') else None
-            self.enabled = CONFIG.get_config('cache', 'enabled', 'true').lower() == 'true'
+            self.backend = CacheBackend(_config('cache', 'backend', 'redis'))
+            self.ttl = int(_config('cache', 'ttl')) if _config('cache', 'ttl') else None
             
             # Prioritize environment variables for security
-            self.redis_host = os.getenv('REDIS_HOST') or CONFIG.get_config('cache', 'redis_host', 'localhost')
-            self.redis_port = int(os.getenv('REDIS_PORT') or CONFIG.get_config('cache', 'redis_port', '6379'))
-            self.redis_password = os.getenv('REDIS_PASSWORD') or CONFIG.get_config('cache', 'redis_password')
-            self.redis_db = int(os.getenv('REDIS_DB') or CONFIG.get_config('cache', 'redis_db', '0'))
+            self.redis_host = os.getenv('REDIS_HOST') or _config('cache', 'redis_host', 'localhost')
+            self.redis_port = int(os.getenv('REDIS_PORT') or _config('cache', 'redis_port', '6379'))
+            self.redis_password = os.getenv('REDIS_PASSWORD') or _config('cache', 'redis_password')
+            self.redis_db = int(os.getenv('REDIS_DB') or _config('cache', 'redis_db', '0'))
             
             # Parse memcached servers
-            memcached_cfg = CONFIG.get_config('cache', 'memcached_servers', 'localhost:11211')
+            memcached_cfg = _config('cache', 'memcached_servers', 'localhost:11211')
             self.memcached_servers = [
                 tuple(s.split(':')) if ':' in s else (s, 11211)
                 for s in memcached_cfg.split(',')
@@ -361,23 +490,38 @@ class CacheConfig:
 
 CACHE_CONFIG = CacheConfig()
 
-def write_hash(filename, algo="sha256"):
-    hash_code = ""
-    file_bytes = ""
+def write_hash(filename, algo=None):
+    # the hash only keys the cache, blake2b (default) is much faster than sha256 here
     logger.info(f"write_hash -> filename: {filename}")
     #h = getattr(hashlib, algo)()
     with open(filename, "rb") as f:
         #while chunk := f.read(8192):
             #h.update(chunk)
         file_bytes = f.read()
-        hash_code = hashlib.sha256(file_bytes).hexdigest()
-        logger.info(f"write_hash -> has_code: {hash_code}")
+    hash_code, file_hash = write_hash_marker(filename, file_bytes, algo)
+    return hash_code, file_hash, file_bytes
+
+def _hash_marker_re(algo):
+    """Match the name of a `<hash>.<algo>` marker file written by write_hash_marker()."""
+    return re.compile(r'^[0-9a-f]{%d}\.%s$' % (hashlib.new(algo).digest_size * 2, re.escape(algo)))
+
+def write_hash_marker(filename, file_bytes, algo=None):
+    """
+    Hash file_bytes (the content of filename) and replace the `<hash>.<algo>` marker next to it.
+    Lets writers that already hold the bytes skip reading the file back.
+    """
+    algo = algo or CACHE_CONFIG.hash_algo
+    hash_code = hashlib.new(algo, file_bytes).hexdigest()
+    logger.info(f"write_hash -> has_code: {hash_code}")
         
     dir_name = os.path.dirname(os.path.realpath(filename))
     logger.info(f"write_hash -> dir_name: {dir_name}")
     file_hash = os.path.join(dir_name, f"{hash_code}.{algo}")
     logger.info(f"write_hash -> file_hash: {file_hash}")
-    check_file_hash = list(filter(lambda k: k.endswith(f".{algo}"), [os.path.join(dir_name, i.strip()) for i in os.listdir(dir_name)]))
+    # only our own markers, never other files that happen to end in .<algo> (e.g. release.sha512),
+    # plus the <hex>.sha256 markers left behind from before hash_algo was configurable
+    patterns = [_hash_marker_re(algo)] + ([_hash_marker_re('sha256')] if algo != 'sha256' else [])
+    check_file_hash = [os.path.join(dir_name, i) for i in os.listdir(dir_name) if any(p.match(i) for p in patterns)]
     
     logger.info(f"write_hash -> check_file_hash: {check_file_hash}")
     
@@ -388,7 +532,7 @@ def write_hash(filename, algo="sha256"):
     with open(file_hash, 'w') as fh:
         fh.write(hash_code)
     
-    return hash_code, file_hash, file_bytes
+    return hash_code, file_hash
 
 class CacheManager:
     """Unified cache manager supporting multiple backends."""
@@ -755,13 +899,16 @@ class CacheManager:
 CACHE = CacheManager()
 
 def get_hash_from_file():
-    dir_name = os.path.dirname(CONFIG.get_config('docker-compose', 'file')) if CONFIG.get_config('docker-compose', 'file') else os.getcwd()
+    compose_file = _config('docker-compose', 'file')
+    dir_name = os.path.dirname(compose_file) if compose_file else os.getcwd()
 
     code_hash = ""    
-    check_file_hash = list(filter(lambda k: k.endswith(".sha256"), [os.path.join(dir_name, i.strip()) for i in os.listdir(dir_name)]))
+    suffix = f".{CACHE_CONFIG.hash_algo}"
+    marker_re = _hash_marker_re(CACHE_CONFIG.hash_algo)
+    check_file_hash = [os.path.join(dir_name, i) for i in os.listdir(dir_name) if marker_re.match(i)]
     logger.warning(f"check_file_hash: {check_file_hash}")
     if check_file_hash:
-        code_hash = os.path.basename(check_file_hash[0]).split(".sha256")[0]
+        code_hash = os.path.basename(check_file_hash[0]).split(suffix)[0]
         logger.notice(f"code_hash: {code_hash}")
     return code_hash
     
@@ -862,7 +1009,11 @@ def cache_with_invalidation(
 
 class DDFServer:
     def __init__(self):
-        if not _SERVER_MODE_AVAILABLE:
+        # the tray/notification modules are heavy, they are only imported once server mode is used
+        try:
+            for module_name in ('pystray', 'PIL.Image', 'PIL.ImageDraw', 'plyer'):
+                lazy_import(module_name)
+        except ImportError:
             raise RuntimeError("⚠️ Server mode requires: pip install pystray Pillow plyer")
         
         self.running = False
@@ -946,12 +1097,13 @@ class DDFServer:
 
     def setup_tray(self):
         try:
-            menu = Menu(
-                MenuItem("🟢 Start Server", lambda: threading.Thread(target=self.run_server, daemon=True).start() if not self.running else None),
-                MenuItem("🔴 Stop Server", lambda: setattr(self, 'running', False) or release_lock()),
-                MenuItem("🚪 Quit", lambda: self.quit_app())
+            pystray = lazy_import('pystray')
+            menu = pystray.Menu(
+                pystray.MenuItem("🟢 Start Server", lambda: threading.Thread(target=self.run_server, daemon=True).start() if not self.running else None),
+                pystray.MenuItem("🔴 Stop Server", lambda: setattr(self, 'running', False) or release_lock()),
+                pystray.MenuItem("🚪 Quit", lambda: self.quit_app())
             )
-            self.icon = Icon("ddf", icon=create_emoji_icon(), menu=menu, title="DDF Server")
+            self.icon = pystray.Icon("ddf", icon=create_emoji_icon(), menu=menu, title="DDF Server")
             notify_user.icon = self.icon
             self.icon.run()
         except:
@@ -970,7 +1122,7 @@ class BackupManager:
     @staticmethod
     def get_backup_dir():
         """Get or create backup directory."""
-        backup_dir = CONFIG.get_config('backup', 'directory') or os.path.join(os.path.dirname(os.path.realpath(__file__)), 'backups')
+        backup_dir = _config('backup', 'directory') or os.path.join(os.path.dirname(os.path.realpath(__file__)), 'backups')
         os.makedirs(backup_dir, exist_ok=True)
         return backup_dir
     
@@ -1086,34 +1238,304 @@ class CustomRichHelpFormatter(RichHelpFormatter):
 
 class DDF:
 
-    _file_cache = {}
+    # parsed compose files, least recently used first
+    _file_cache = OrderedDict()
+    _file_cache_size = 32
     THEME = "fruity"
+    # file extension -> Syntax lexer name for read_file
+    SYNTAX_MAP = {
+        '.sh': 'bash',
+        '.py': 'python',
+        '.yml': 'yaml',
+        '.yaml': 'yaml',
+        '.conf': 'ini',
+        '.json': 'json',
+        '.js': 'javascript',
+        '.ts': 'typescript',
+        '.env': 'bash',
+        '.txt': 'text',
+        '.ini': 'ini',
+        '.md': 'markdown',
+        '.dockerfile': 'dockerfile',
+    }
 
     @classmethod
-    @cache_with_invalidation(validation = compare_hash)
-    def open_file(cls, file_path):
+    def _get_editors(cls):
+        """
+        Return the configured editor names, re-read only when ddf.ini changes.
+        """
+        return _config_memo(
+            ('DDF', 'editors'),
+            lambda: CONFIG.get_config_as_list('editor', 'names') or [r'c:\msys64\usr\bin\nano.exe', 'nvim', 'vim']
+        )
+
+    @classmethod
+    def _launch_editor(cls, path):
+        """
+        Open path with the first installed editor, falling back to the next one if it fails.
+        Editors are resolved on PATH again only when ddf.ini changes. Returns True when an editor exited successfully.
+        """
+        editor_paths = _config_memo(('DDF', 'editor_paths'), lambda: [p for p in map(shutil.which, cls._get_editors()) if p])
+        for editor in editor_paths:
+            try:
+                # editor is an absolute shutil.which() path and our fds are non-inheritable (PEP 446),
+                # so without close_fds CPython can start it with posix_spawn instead of fork+exec
+                safe_subprocess_run([editor, path], **({} if sys.platform == 'win32' else {'close_fds': False}))
+                return True
+            except subprocess.CalledProcessError as e:
+                console.print(f"\n❌ [red]Error launching {editor}:[/] {e}")
+            except Exception as e:
+                console.print(f"\n❌ [red]Unexpected error launching {editor}:[/] {e}")
+        return False
+
+    @classmethod
+    def _write_service_block(cls, file_path, name, value, exists):
+        """
+        Write a single service into the compose file without re-emitting the rest of it.
+        The service's block is replaced when it exists, otherwise it is added at the end of `services:`.
+        Returns False when the layout is not recognised so the caller can rewrite the whole file.
+        """
+        try:
+            text = Path(file_path).read_bytes().decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return False
+        lines = text.splitlines(keepends=True)
+        newline = '\r\n' if text.endswith('\r\n') or '\r\n' in text[:4096] else '\n'
+
+        def is_content(line):
+            stripped = line.strip()
+            return bool(stripped) and not stripped.startswith('#')
+
+        def indent_of(line):
+            return len(line) - len(line.lstrip(' '))
+
+        starts = [i for i, line in enumerate(lines) if _SERVICES_KEY_RE.match(line)]
+        if len(starts) != 1:
+            return False
+
+        # the services mapping runs until the next top level key
+        end, indent = len(lines), None
+        for i in range(starts[0] + 1, len(lines)):
+            if not is_content(lines[i]):
+                continue
+            if indent_of(lines[i]) == 0:
+                end = i
+                break
+            if indent is None:
+                indent = indent_of(lines[i])
+        if not indent:
+            return False
+
+        key_re = re.compile(r'^ {%d}(["\']?)%s\1\s*:\s*(#.*)?$' % (indent, re.escape(name)))
+        block_start = block_end = None
+        for i in range(starts[0] + 1, end):
+            if key_re.match(lines[i].rstrip('\r\n')):
+                block_start, block_end = i, end
+                for j in range(i + 1, end):
+                    if is_content(lines[j]) and indent_of(lines[j]) <= indent:
+                        block_end = j
+                        break
+                break
+        if (block_start is not None) != exists:
+            return False
+        if block_start is None:
+            # add after the last service, before any blank lines or comments leading to the next key
+            block_start = end
+            while block_start > starts[0] + 1 and not is_content(lines[block_start - 1]):
+                block_start -= 1
+            block_end = block_start
+            if not lines[block_start - 1].endswith('\n'):
+                lines[block_start - 1] += newline
+        else:
+            # keep the blank lines and comments that separate the block from what follows
+            while block_end > block_start and not is_content(lines[block_end - 1]):
+                block_end -= 1
+            # anchors defined in the old block may be referenced elsewhere
+            if any('&' in line for line in lines[block_start:block_end]):
+                return False
+
+        dumped = yaml.dump({name: value}, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
+        # shared values are dumped as &id001/*id001, which may clash with anchors already in the file
+        if any(getattr(event, 'anchor', None) for event in yaml.parse(dumped, Loader=YAML_LOADER)):
+            return False
+        block = [(' ' * indent + line if line else line) + newline for line in dumped.splitlines()]
+        lines[block_start:block_end] = block
+
+        data = ''.join(lines).encode('utf-8')
+        _atomic_write(file_path, data)
+        try:
+            file_hash, _ = write_hash_marker(file_path, data)
+            CACHE.set("yaml:hash", file_hash)
+        except OSError:
+            pass
+        return True
+
+    @classmethod
+    def _write_yaml(cls, file_path, content):
+        """
+        Dump content to the YAML file, serialized in memory first and replaced atomically.
+        """
+        data = yaml.dump(content, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
+        # encoded as text mode would write it, so the bytes can be hashed without reading the file back
+        data = data.replace('\n', os.linesep).encode('utf-8')
+        _atomic_write(file_path, data)
+        # we know what the file now parses to, so a following open_file (e.g. a second mutating
+        # option in the same run, or the next run via the sidecar) does not have to parse it again
+        try:
+            st = os.stat(file_path)
+            # keep the hash marker in step, results cached by cache_with_invalidation are keyed on it
+            file_hash, _ = write_hash_marker(file_path, data)
+            CACHE.set("yaml:hash", file_hash)
+        except OSError:
+            return
+        key = os.path.realpath(file_path)
+        content = copy.deepcopy(content)
+        cls._remember(key, st, content)
+        cls._write_sidecar(key, st, content)
+
+    @classmethod
+    def _remember(cls, key, st, content):
+        cls._file_cache[key] = (st.st_mtime_ns, st.st_size, content)
+        cls._file_cache.move_to_end(key)
+        while len(cls._file_cache) > cls._file_cache_size:
+            cls._file_cache.popitem(last=False)
+
+    @classmethod
+    def open_file(cls, file_path, st=None):
+        """
+        Load the YAML file, reusing the parsed content while the file's mtime and size are unchanged.
+        Callers get their own copy, so editing the returned content never leaks into the cache.
+        Pass `st` when the caller already has the file's os.stat result.
+        """
+        file_path = file_path or _config('docker-compose', 'file')
+        try:
+            st = st or os.stat(file_path)
+        except (OSError, ValueError):
+            # let _load_file raise the proper error
+            return cls._load_file(file_path)
+
+        key = os.path.realpath(file_path)
+        cached = cls._file_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            cls._file_cache.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
+        content = cls._read_sidecar(key, st)
+        if content is None:
+            content = cls._load_file(file_path, st)
+            cls._write_sidecar(key, st, content)
+        cls._remember(key, st, content)
+        return copy.deepcopy(content)
+
+    @classmethod
+    def _sidecar_name(cls, key):
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+    @classmethod
+    def _sidecar_store(cls):
+        """
+        Where the parsed content is kept: 'redis' for the JSON redis backend, 'file' for a JSON file
+        in the private per-user directory, None when caching is off.
+        Decided on the backend actually in use, CacheManager falls back to pickle when redis/memcached
+        is unreachable, and the parsed content is never handed to a pickle-serializing backend.
+        """
+        if not CACHE_CONFIG.enabled:
+            return None
+        CACHE._get_client()
+        if CACHE.backend == CacheBackend.NONE:
+            return None
+        return 'redis' if CACHE.backend == CacheBackend.REDIS else 'file'
+
+    @classmethod
+    def _read_sidecar(cls, key, st):
+        """
+        Return the content parsed by an earlier run if the file's mtime and size still match, else None.
+        """
+        store = cls._sidecar_store()
+        if store is None:
+            return None
+        name = cls._sidecar_name(key)
+        try:
+            if store == 'file':
+                cache_dir = _private_cache_dir()
+                if cache_dir is None:
+                    return None
+                with open(cache_dir / f"{name}.ddfcache", 'rb') as f:
+                    entry = json.load(f)
+            else:
+                entry = CACHE.get(f"parsed:{name}")
+        except Exception:
+            return None
+        if not isinstance(entry, dict) or entry.get('path') != key:
+            return None
+        if entry.get('mtime_ns') != st.st_mtime_ns or entry.get('size') != st.st_size:
+            return None
+        return entry.get('content')
+
+    @classmethod
+    def _write_sidecar(cls, key, st, content):
+        """
+        Save the parsed content with the file's mtime and size so the next run can skip parsing.
+        Content that does not survive a JSON round trip (dates, non-string keys, ...) is not saved.
+        """
+        if not _is_plain_data(content):
+            return
+        store = cls._sidecar_store()
+        if store is None:
+            return
+        name = cls._sidecar_name(key)
+        entry = {'path': key, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'content': content}
+        if store == 'redis':
+            CACHE.set(f"parsed:{name}", entry)
+            return
+        cache_dir = _private_cache_dir()
+        if cache_dir is None:
+            return
+        try:
+            _atomic_write(cache_dir / f"{name}.ddfcache", json.dumps(entry, ensure_ascii=False), mode=0o600)
+        except Exception as e:
+            logger.warning(f"Failed to write parse cache in {cache_dir}: {e}")
+
+    @classmethod
+    def _load_file(cls, file_path, st=None):
         logger.debug("open file calling ...")
         logger.info(f"file_path: {file_path}")
         
-        file_path = file_path or CONFIG.get_config('docker-compose', 'file')
+        file_path = file_path or _config('docker-compose', 'file')
         logger.notice(f"file_path: {file_path}")
         
-        if not os.path.isfile(file_path):
+        # open_file hands over its own os.stat result, so a cold load stats the file only once
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except (OSError, ValueError):
+                st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise FileNotFoundError(f"❌ The file {file_path} does not exist.")
         if not os.access(file_path, os.R_OK):
             raise PermissionError(f"❌ The file {file_path} is not readable.")
-        if os.path.getsize(file_path) == 0:
+        if st.st_size == 0:
             raise ValueError(f"❌ The file {file_path} is empty.")
 
         file_hash, _, file_bytes = write_hash(file_path)
         CACHE.set(f"yaml:hash", file_hash)
 
+        content = None
+        # JSON is valid YAML and the json module parses it much faster than any YAML loader
+        if file_bytes[:64].lstrip()[:1] == b'{':
+            try:
+                content = json.loads(file_bytes)
+            except ValueError:
+                content = None
+
         try:
-            content = yaml.safe_load(file_bytes.decode('utf-8'))
+            if content is None:
+                # hand the raw bytes to the loader, it detects and decodes the encoding itself
+                content = yaml.load(file_bytes, Loader=YAML_LOADER)
+        except yaml.reader.ReaderError as e:
+            raise ValueError(f"❌ The file {file_path} has invalid encoding: {e}")
         except yaml.YAMLError as e:
             raise ValueError(f"❌ The file {file_path} is not a valid YAML file: {e}")
-        except UnicodeDecodeError as e:
-            raise ValueError(f"❌ The file {file_path} has invalid encoding: {e}")
 
         if not content or not isinstance(content, dict):
             raise ValueError(f"❌ The file {file_path} is empty or not a valid YAML mapping.")
@@ -1125,14 +1547,14 @@ class DDF:
     def find_service(cls, content, service):
         """
         Find a service in the YAML content.
-        Supports pattern matching and substring search.
+        An exact service name is returned as is, otherwise pattern matching and substring search are used.
         """
         services = content.get('services', {})
+        if service in services:
+            return service
         # Support the pattern/wildcard and substring
-        matched = [
-            svc for svc in services
-            if fnmatch.fnmatch(svc, service) or service in svc
-        ]
+        match = _compile_glob(service)
+        matched = [svc for svc in services if match(svc)]
         if not matched:
             console.print(f"\n❌ [yellow]Service pattern '{service}' not found.[/]")
             return None
@@ -1154,36 +1576,21 @@ class DDF:
                 console.print(f"\n❌ [yellow]Service '{matched}' not found.[/]")
                 return
             console.print(f"\n🔧 [bold cyan]Configuration for service '{matched}':[/]\n")
-            yaml_str = yaml.dump({matched: service_val}, sort_keys=False, allow_unicode=True)
+            yaml_str = yaml.dump({matched: service_val}, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
             syntax = Syntax(yaml_str, "yaml", theme="fruity", line_numbers=True if line_numbers else False, word_wrap=True)
             console.print(syntax)
         else:
+            renderables = []
             for svc in matched:
                 service_val = services.get(svc)
                 if not service_val:
-                    console.print(f"\n❌ [yellow]Service '{svc}' not found.[/]")
+                    renderables.append(f"\n❌ [yellow]Service '{svc}' not found.[/]")
                     continue
-                console.print(f"\n🔧 [bold cyan]Configuration for service '{svc}':[/]\n")
-                yaml_str = yaml.dump({svc: service_val}, sort_keys=False, allow_unicode=True)
-                syntax = Syntax(yaml_str, "yaml", theme="fruity", line_numbers=True, word_wrap=True)
-                console.print(syntax)
+                renderables.append(f"\n🔧 [bold cyan]Configuration for service '{svc}':[/]\n")
+                yaml_str = yaml.dump({svc: service_val}, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
+                renderables.append(Syntax(yaml_str, "yaml", theme="fruity", line_numbers=True, word_wrap=True))
+            console.print(Group(*renderables))
             
-    @classmethod
-    def list_service_ports(cls, content, service):
-        services = content.get('services', {})
-        # debug(services = services)
-        service_val = services.get(service)
-        if not isinstance(service_val, dict):
-            console.print(f"\n❌ [yellow]Service '{service}' is not a dictionary or has no ports defined.[/]")
-            return
-        ports = service_val.get('ports', [])
-        if not ports:
-            console.print(f"\n❌ [yellow]No ports found for service:[/] {service}")
-            return
-        console.print(f"\n🚩 [bold cyan]Ports for service '{service}':[/]\n")
-        for port in ports:
-            console.print(f"• [green]{port}[/]")
-
     @classmethod
     def find_duplicate_port(cls, content, target_service=None):
         if content is None or not isinstance(content, dict):
@@ -1197,38 +1604,40 @@ class DDF:
             if not isinstance(value, dict):
                 continue  # skip jika value bukan dict
             ports = value.get('ports', [])
-            if all(isinstance(x, str) and ':' in x for x in ports):
-                parsed_ports = []
-                for x in ports:
-                    hp, cp = x.split(':')
-                    hp_proto = f"{hp}/tcp" if '/' not in hp and '/udp' not in cp else f"{hp}/udp" if '/udp' in cp else f"{hp}/tcp"
-                    cp_proto = cp if '/' in cp else f"{cp}/tcp"
-                    parsed_ports.append((hp_proto, cp_proto))
-                
-                for host_port, container_port in parsed_ports:
-                    if host_port in seen_host_ports:
-                        existing = seen_host_ports[host_port]
-                        duplicates.append((f"{service}/ports/{host_port}", f"{existing}/ports/{host_port}", host_port))
-                    else:
-                        seen_host_ports[host_port] = service
-
-        for d in duplicates:
-            s1, _, port1, protocol1 = d[0].split("/")
-            s2, _, port2, protocol2 = d[1].split("/")
+            for x in ports:
+                # skip anything that is not a "host:container" string
+                m = _PORT_RE.match(x.strip()) if isinstance(x, str) else None
+                if not m:
+                    continue
+                hp = f"{m['ip']}:{m['hp']}" if m['ip'] else m['hp']
+                protocol = (m['cproto'] or m['hproto'] or '/tcp')[1:]
+                host_port = f"{hp}/{protocol}"
+                if host_port in seen_host_ports:
+                    duplicates.append((service, seen_host_ports[host_port], hp, protocol))
+                else:
+                    seen_host_ports[host_port] = service
 
+        found = []
+        lines = []
+        for s1, s2, port, protocol in duplicates:
             if target_service and target_service not in (s1, s2):
                 continue
+            found.append((s1, s2, f"{port}/{protocol}"))
 
-            console.print(
+            lines.append(
                 "❌ "
                 f"[bold #00FFFF]{s1}[/]/"
-                f"[white on #0000FF]{port1}[/]/"
-                f"[black on #55FF00]{protocol1}[/] "
+                f"[white on #0000FF]{port}[/]/"
+                f"[black on #55FF00]{protocol}[/] "
                 f"[bold #FFAA00]-->[/] "
                 f"[bold #00FFFF]{s2}[/]/"
-                f"[white on #5350000]{port2}[/]/"
-                f"[black on #55FF00]{protocol2}[/] "
+                f"[white on #5350000]{port}[/]/"
+                f"[black on #55FF00]{protocol}[/] "
             )
+        if lines:
+            console.print(Group(*lines))
+
+        return found
             
     @classmethod
     def find_port(cls, content, port, compact=True):
@@ -1243,31 +1652,24 @@ class DDF:
             ports = value.get('ports', [])
             if not ports:
                 continue
-            matched_ports = []
-            for p in ports:
-                try:
-                    p1, p2 = str(p).split(":")
-                    if p1.strip() == port or p2.strip() == port:
-                        matched_ports.append(f"[white on #550000]{p1}[/]:[white on #550000]{p2}[/]")
-                        # matched_ports.append(f"{p1}:{p2}")
-                except Exception as e:
-                    pass
+            # parse each mapping once, the matches are reused for the full listing below
+            parsed = [m for m in (_PORT_RE.match(str(p).strip()) for p in ports) if m]
+            matched_ports = [
+                f"[white on #550000]{m['host']}[/]:[white on #550000]{m['container']}[/]"
+                for m in parsed if port in (m['hp'], m['cp'])
+            ]
             if matched_ports:
                 found_any = True
                 # Format default (lama): tampilkan semua port
                 output_lines.append(f"- [bold #FFFF00]{service}[/]:")
                 output_lines.append("  ports:")
-                for p in ports:
-                    try:
-                        p1, p2 = p.split(":")
-                        p2 = p2.replace("/udp", f"[bold #FF00FF]/udp[/]").replace("/tcp", f"[bold #FF00FF]/tcp[/]")
-                        if p1.strip() == port or p2.strip() == port:
-                            output_lines.append(f"    - [white on #550000]{p1}[/]:[white on #550000]{p2}[/]")
-                        else:
-                            # output_lines.append(f"    - {p}")
-                            output_lines.append(f"    - [#00FFFF]{p1}[/]:[#00FFFF]{p2}[/]")
-                    except Exception as e:
-                        pass
+                for m in parsed:
+                    p1 = m['host']
+                    p2 = m['container'].replace("/udp", f"[bold #FF00FF]/udp[/]").replace("/tcp", f"[bold #FF00FF]/tcp[/]")
+                    if port in (m['hp'], m['cp']):
+                        output_lines.append(f"    - [white on #550000]{p1}[/]:[white on #550000]{p2}[/]")
+                    else:
+                        output_lines.append(f"    - [#00FFFF]{p1}[/]:[#00FFFF]{p2}[/]")
                 # Format compact: hanya port yang cocok
                 img = value.get('image', '')
                 ports_str = ', '.join([f'"{x}"' for x in matched_ports])
@@ -1275,12 +1677,7 @@ class DDF:
 
         if found_any:
             console.print("\n✅ [bold #00FFFF]Found service using port[/] [bold #FFAA00]{}[/]:\n".format(port))
-            if compact:
-                for line in compact_lines:
-                    console.print(line)
-            else:
-                for line in output_lines:
-                    console.print(line)
+            console.print(Group(*(compact_lines if compact else output_lines)))
         else:
             console.print(f"👍 [black in #FFFF00]No service found with port {port}[/]")        
             
@@ -1297,9 +1694,8 @@ class DDF:
             ports = value.get('ports', [])
             for p in ports:
                 # Support format host:container or just port
-                parts = str(p).split(":")
-                # if port in [x.strip() for x in parts]:
-                if port == parts[0].strip():
+                m = _PORT_RE.match(str(p).strip())
+                if port == (m['hp'] if m else str(p).strip()):
                     found.append((service, p))
         if len(found) > 1:
             console.print(f"❌ [#FF00FF]Port[/] [bold #FFFF00]{port}[/] [#FF00FF]is DUPLICATE in these services:[/]")
@@ -1317,9 +1713,11 @@ class DDF:
     def list_service_devices(cls, content, service=None):
         services = content.get('services', {})
         found = False
+        lines = []
+        match = _compile_glob(service) if service else None
         for svc, value in services.items():
             # Support the pattern/wildcard and substring
-            if service and not (fnmatch.fnmatch(svc, service) or service in svc):
+            if service and not match(svc):
                 continue
             if not isinstance(value, dict):
                 continue
@@ -1327,12 +1725,14 @@ class DDF:
             devices = value.get('devices', [])
             if devices:
                 found = True
-                console.print(f"[bold cyan]{svc}:[/]")
-                console.print("  devices:")
+                lines.append(f"[bold cyan]{svc}:[/]")
+                lines.append("  devices:")
                 for dev in devices:
-                    de = dev.split(':')
-                    console.print(f"    [bold #FFAA00]- {de[0]}[/]: [bold #00AAFF]{de[1]}[/]" if len(de) > 1 else f"    [bold #FFAA00]- {dev}[/]")
-        if not found:
+                    src, sep, dst = dev.partition(':')
+                    lines.append(f"    [bold #FFAA00]- {src}[/]: [bold #00AAFF]{dst}[/]" if sep else f"    [bold #FFAA00]- {dev}[/]")
+        if found:
+            console.print(Group(*lines))
+        else:
             if service:
                 console.print(f"⚠️ [yellow]No devices found for service pattern:[/] {service}")
             else:
@@ -1345,21 +1745,25 @@ class DDF:
         """
         services = content.get('services', {})
         found = False
+        lines = []
+        match = _compile_glob(service) if service else None
         for svc, value in services.items():
-            if service and not (fnmatch.fnmatch(svc, service) or service in svc):
+            if service and not match(svc):
                 continue
             if not isinstance(value, dict):
                 continue
             volumes = value.get('volumes', [])
             if volumes:
-                console.print(f"\n🔧 [bold cyan]Volumes for service[/] [#FFFF00]'{svc}'[/]:\n")
+                lines.append(f"\n🔧 [bold cyan]Volumes for service[/] [#FFFF00]'{svc}'[/]:\n")
                 found = True
-                console.print(f"[white on #5500FF italic underline]{svc}[/]:")
-                console.print("  volumes:")
+                lines.append(f"[white on #5500FF italic underline]{svc}[/]:")
+                lines.append("  volumes:")
                 for vol in volumes:
-                    vo = vol.split(':')
-                    console.print(f"    - [bold #00AAFF]{vo[0]}[/]: [bold #FFAA00]{vo[1]}[/]" if len(vo) > 1 else f"    - [bold #00AAFF]{vol}[/]")
-        if not found:
+                    src, sep, dst = vol.partition(':')
+                    lines.append(f"    - [bold #00AAFF]{src}[/]: [bold #FFAA00]{dst}[/]" if sep else f"    - [bold #00AAFF]{vol}[/]")
+        if found:
+            console.print(Group(*lines))
+        else:
             if service:
                 console.print(f"⚠️ [yellow]No volumes found for service pattern:[/] {service}")
             else:
@@ -1380,13 +1784,14 @@ class DDF:
         found = []
         if service:
             services = content.get('services', {})
+            match = _compile_glob(service)
             for svc, value in services.items():
-                if service and not (fnmatch.fnmatch(svc, service) or service in svc):
+                if not match(svc):
                     continue
                 if not isinstance(value, dict):
                     continue
                 service_volumes = value.get('volumes', [])
-                ch = list(filter(lambda k: k.split(":")[0] in volumes, service_volumes))
+                ch = list(filter(lambda k: k.partition(":")[0] in volumes, service_volumes))
                 if ch:
                     found.append({svc: ch})
 
@@ -1396,7 +1801,7 @@ class DDF:
                 for ffo, vo in fo.items():
                     console.print(f"   [#FFAA00]*[/] [bold #FFAAFF]{ffo}[/]:")
                     for ffo in vo:
-                        name, path = ffo.split(":")
+                        name, _, path = ffo.partition(":")
                         console.print(f"      - [bold #00FFFF]{name}[/]:[bold #FFFF00]{path}[/]")
 
     @classmethod
@@ -1407,8 +1812,9 @@ class DDF:
         services = content.get('services', {})
         found = False
         lines = []
+        match = _compile_glob(service) if service else None
         for svc, value in services.items():
-            if service and not (fnmatch.fnmatch(svc, service) or service in svc):
+            if service and not match(svc):
                 continue
             if not isinstance(value, dict):
                 continue
@@ -1424,7 +1830,7 @@ class DDF:
                 console.print(f"❌ [yellow]No hostnames found in any service.[/]")
         else:
             console.print("\n✅ [bold #00FFFF]Hostnames found:[/]\n")
-            table = Table(show_header=False, show_edge=False, box=None, show_lines=False, pad_edge=False)
+            table = lazy_import('rich.table', 'Table')(show_header=False, show_edge=False, box=None, show_lines=False, pad_edge=False)
             # table = Table(box=box.SQUARE, show_lines = True)
             table.add_column("service", justify = "left")
             table.add_column("", justify = "left")
@@ -1437,19 +1843,26 @@ class DDF:
     def list_service_ports(cls, content, service):
         """
         List all ports for a given service.
+        Falls back to pattern matching and substring search when there is no exact match.
         """
         services = content.get('services', {})
-        service_val = services.get(service)
-        if not service_val:
+        if service in services:
+            matched = [service]
+        else:
+            match = _compile_glob(service)
+            matched = [svc for svc in services if match(svc)]
+        if not matched:
             console.print(f"\n❌ [yellow]Service '{service}' not found.[/]")
             return
-        ports = service_val.get('ports', [])
-        if not ports:
-            console.print(f"[yellow]No ports found for service:[/] {service}")
-            return
-        console.print(f"\n📌 [bold cyan]Ports for service '{service}':[/]\n")
-        for port in ports:
-            console.print(f"  - [green]{port}[/]")
+        for svc in matched:
+            service_val = services.get(svc)
+            ports = service_val.get('ports', []) if isinstance(service_val, dict) else []
+            if not ports:
+                console.print(f"[yellow]No ports found for service:[/] {svc}")
+                continue
+            console.print(f"\n📌 [bold cyan]Ports for service '{svc}':[/]\n")
+            for port in ports:
+                console.print(f"  - [green]{port}[/]")
     
     @classmethod
     @cache_with_invalidation(validation = compare_hash)
@@ -1470,11 +1883,9 @@ class DDF:
                     continue
                 except re.error:
                     pass
-                # Wildcard (fnmatch)
-                import fnmatch
-                filtered.update([svc for svc in service_names if fnmatch.fnmatch(svc, f)])
-                # Substring
-                filtered.update([svc for svc in service_names if f in svc])
+                # Wildcard (fnmatch) or substring
+                match = _compile_glob(f)
+                filtered.update([svc for svc in service_names if match(svc)])
             service_names = sorted(filtered)
         
         logger.notice(f"service_names: {service_names}")
@@ -1507,11 +1918,15 @@ class DDF:
             console.print(f"❌ [red]{e}[/]")
             return None
 
-        root_path = CONFIG.get_config('docker-compose', 'root_path') if CONFIG.get_config('docker-compose', 'root_path') and os.path.isdir(CONFIG.get_config('docker-compose', 'root_path')) else r"c:\PROJECTS" if os.path.isdir(r"c:\PROJECTS") else os.getcwd()
-        content = cls.open_file(CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml")
+        root_path = _config('docker-compose', 'root_path')
+        if not (root_path and os.path.isdir(root_path)):
+            root_path = r"c:\PROJECTS" if os.path.isdir(r"c:\PROJECTS") else os.getcwd()
+        content = cls.open_file(_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml")
         services = content.get('services', {})
-        check1 = list(filter(lambda k: service_name.lower() == k.lower(), list(services.keys())))
-        check2 = list(filter(lambda k: service_name.lower() in k.lower(), list(services.keys())))
+        # exact matches are a subset of the substring matches, lower() each name only once
+        needle = service_name.lower()
+        check2 = [k for k in services if needle in k.lower()]
+        check1 = [k for k in check2 if k.lower() == needle]
         
         if check1 and not show_all:
             if len(check2) > 1:
@@ -1524,8 +1939,8 @@ class DDF:
             for index, name in enumerate(check2):
                 console.print(f"    [bold #AAAAFF]{str(index + 1).zfill(len(str(len(check2))))}.[/] [#bold #FFAA00]{name}[/]")
             q = console.input(f"\n📚 [white on blue]Which one to edit: ")
-            if q and q.isdigit() and int(q) <= len(check2):
-                service_name = check[int(q) - 1]
+            if q and q.isdigit() and 0 < int(q) <= len(check2):
+                service_name = check2[int(q) - 1]
         elif len(check2) == 1:
             service_name = check2[0]
         
@@ -1566,8 +1981,7 @@ class DDF:
             console.print(f"\n❌ [white on red]Dockerfile not found:[/] {path}")
             return None
         try:
-            with open(path, 'r') as f:
-                content = f.read()
+            content = _read_text(path)
             if not content:
                 console.print(f"\n🔵 [yellow]Dockerfile is empty:[/] {path}")
                 return None
@@ -1596,7 +2010,7 @@ class DDF:
             return Non
 
         # Get docker-compose.yml path and context dir
-        compose_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        compose_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         base_dir = os.path.dirname(os.path.abspath(compose_file))
         content = cls.open_file(compose_file)
         services = content.get('services', {})
@@ -1625,7 +2039,7 @@ class DDF:
                         # ENTRYPOINT ["..."] or ENTRYPOINT ['...']
                         entrypoint_str = line_strip.split('ENTRYPOINT', 1)[1].strip()
                         try:
-                            entrypoint_list = yaml.safe_load(entrypoint_str)
+                            entrypoint_list = yaml.load(entrypoint_str, Loader=YAML_LOADER)
                             if isinstance(entrypoint_list, list) and entrypoint_list:
                                 entrypoint = entrypoint_list[0]
                             else:
@@ -1725,7 +2139,7 @@ class DDF:
             return None
 
         # Load docker-compose.yml
-        compose_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        compose_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(compose_file):
             console.print(f"\n❌ [white on red]docker-compose.yml not found:[/] {compose_file}")
             return None
@@ -1776,7 +2190,7 @@ class DDF:
                 try:
                     rest = stripped.split('ENTRYPOINT', 1)[1].strip()
                     if rest.startswith('[') and rest.endswith(']'):
-                        parsed = yaml.safe_load(rest)
+                        parsed = yaml.load(rest, Loader=YAML_LOADER)
                         if isinstance(parsed, list) and parsed:
                             entrypoint = parsed[0]
                         else:
@@ -1859,7 +2273,7 @@ class DDF:
             return None
 
         # Load docker-compose.yml to find actual service name
-        compose_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        compose_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(compose_file):
             console.print(f"\n❌ [white on red]docker-compose.yml not found:[/] {compose_file}")
             return None
@@ -1900,32 +2314,31 @@ class DDF:
 
         # Parse Dockerfile
         try:
-            with open(dockerfile_path, 'r') as f:
-                lines = f.readlines()
+            lines = _read_text(dockerfile_path).splitlines()
         except Exception as e:
             console.print(f"\n❌ [red]Error reading Dockerfile:[/] {e}")
             return None
 
-        copy_instructions = []
+        copies = []
         entrypoint = None
 
         for line in lines:
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
+            m = _COPY_RE.match(line)
+            if m:
+                copies.append(m.groups())
                 continue
-            if stripped.startswith('COPY'):
-                copy_instructions.append(stripped)
-            elif stripped.startswith('ENTRYPOINT'):
-                try:
-                    rest = stripped.split('ENTRYPOINT', 1)[1].strip()
-                    if rest.startswith('[') and rest.endswith(']'):
-                        parsed = yaml.safe_load(rest)
-                        entrypoint = parsed[0] if isinstance(parsed, list) and parsed else rest
-                    else:
-                        entrypoint = rest.strip('"\'')
-                except Exception as e:
-                    console.print(f"\n⚠️ [yellow]Failed to parse ENTRYPOINT:[/] {e}")
-                    entrypoint = rest if 'rest' in locals() else None
+            m = _ENTRYPOINT_RE.match(line)
+            if m:
+                rest = m.group(1).strip()
+                if rest.startswith('[') and rest.endswith(']'):
+                    try:
+                        parsed = ast.literal_eval(rest)
+                    except (ValueError, SyntaxError) as e:
+                        console.print(f"\n⚠️ [yellow]Failed to parse ENTRYPOINT:[/] {e}")
+                        parsed = None
+                    entrypoint = parsed[0] if isinstance(parsed, list) and parsed else rest
+                else:
+                    entrypoint = rest.strip('"\'')
                 break
 
         if not entrypoint:
@@ -1934,13 +2347,11 @@ class DDF:
 
         # Find matching COPY
         entrypoint_src = None
-        for copy_line in copy_instructions:
-            parts = copy_line.split()
-            if len(parts) >= 3:
-                src, dst = parts[1], parts[2]
-                if dst == entrypoint or os.path.basename(dst) == os.path.basename(entrypoint):
-                    entrypoint_src = src
-                    break
+        entrypoint_name = os.path.basename(entrypoint)
+        for src, dst in copies:
+            if dst == entrypoint or os.path.basename(dst) == entrypoint_name:
+                entrypoint_src = src
+                break
 
         # Resolve entrypoint path
         if entrypoint_src:
@@ -1964,8 +2375,7 @@ class DDF:
 
         if read:
             try:
-                with open(entrypoint_path, 'r') as f:
-                    content = f.read()
+                content = _read_text(entrypoint_path)
                 syntax = Syntax(content, "bash", theme="fruity", line_numbers=line_numbers, word_wrap=True)
                 console.print(f"\n✅ [bold cyan]Entrypoint script for service[/] '[black on #FFFF00]{actual_service_name}[/]':\n")
                 console.print(syntax)
@@ -1994,18 +2404,9 @@ class DDF:
         
         BackupManager.create_backup(entrypoint_path, operation_type="edit")
 
-        editors = CONFIG.get_config_as_list('editor', 'names') or [r'c:\msys64\usr\bin\nano.exe', 'nvim', 'vim']
-        print(f"EDITORS: {editors}")
-        for editor in editors:
-            if shutil.which(editor):
-                try:
-                    # subprocess.run([editor, entrypoint_path], check=True)
-                    safe_subprocess_run([editor, entrypoint_path])
-                    console.print(f"✅ [green]Entrypoint '{entrypoint_path}' edited successfully.[/]")
-                    return
-                except subprocess.CalledProcessError as e:
-                    console.print(f"\n❌ [red]Error launching {editor}:[/] {e}")
-                    continue
+        if cls._launch_editor(entrypoint_path):
+            console.print(f"✅ [green]Entrypoint '{entrypoint_path}' edited successfully.[/]")
+            return
         console.print("\n❌ [white on red]No suitable editor found to edit the entrypoint script.[/]")
     
     @classmethod
@@ -2026,7 +2427,7 @@ class DDF:
                 console.print(f"❌ [red]{e}[/]")
                 return None
 
-            compose_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+            compose_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
             try:
                 content = cls.open_file(compose_file)
                 services = content.get('services', {})
@@ -2034,7 +2435,7 @@ class DDF:
                 build = service_val.get('build', {})
                 build_ctx = build.get('context', '.')
                 dockerfile_name = build.get('dockerfile', 'Dockerfile')
-                root_path = CONFIG.get_config('docker-compose', 'root_path')
+                root_path = _config('docker-compose', 'root_path')
                 if root_path and os.path.isdir(root_path):
                     base_dir = root_path
                 else:
@@ -2072,16 +2473,8 @@ class DDF:
                 return None
 
         # Select editor
-        editors = CONFIG.get_config_as_list('editor', 'names') or [r'c:\msys64\usr\bin\nano.exe', 'nvim', 'vim']
-        for editor in editors:
-            if shutil.which(editor):
-                try:
-                    # subprocess.run([editor, dockerfile_path], check=True)
-                    safe_subprocess_run([editor, dockerfile_path])
-                    return
-                except subprocess.CalledProcessError as e:
-                    console.print(f"\n❌ [red]Error launching {editor}:[/] {e}")
-                    continue
+        if cls._launch_editor(dockerfile_path):
+            return
         console.print("\n❌ [white on red]No suitable editor found to edit the Dockerfile.[/]")
         
     @classmethod
@@ -2091,7 +2484,8 @@ class DDF:
         Only the selected service section will be edited and replaced back.
         """
         is_changed = True
-        file_path = file_path or CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        updated = []
+        file_path = file_path or _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         
         if not service_name:
             console.print("⚠️ [white on red]No service name provided for editing.[/]")
@@ -2109,15 +2503,16 @@ class DDF:
 
         # Load YAML
         try:
-            with open(file_path, 'r') as f:
-                content = yaml.safe_load(f)
+            with open(file_path, 'rb') as f:
+                content = yaml.load(f, Loader=YAML_LOADER)
         except Exception as e:
             console.print(f"❌ [red]Error loading YAML:[/] {e}")
             return
 
         services = content.get('services', {})
         # Cari service yang cocok (pattern/wildcard/substring)
-        matched = [svc for svc in services if fnmatch.fnmatch(svc, service_name) or service_name in svc]
+        match = _compile_glob(service_name)
+        matched = [svc for svc in services if match(svc)]
         if not matched:
             console.print(f"⚠️ [yellow]Service pattern '{service_name}' not found.[/]")
             return
@@ -2144,27 +2539,13 @@ class DDF:
             console.print(f"📝 [bold #FFFF00]Opening[/] [bold #00FFFF]{svc}[/] [bold #FFFF00]service config in editor...\n[/]")
             svc_data = services[svc]
             # Save Section to Temporary Files
-            with tempfile.NamedTemporaryFile('w+', delete=False, suffix='.yml') as tf:
+            # keep the bytes we write, comparing against them is cheaper than hashing the file twice
+            before_bytes = yaml.dump({svc: svc_data}, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True).encode('utf-8')
+            with tempfile.NamedTemporaryFile('wb', delete=False, suffix='.yml') as tf:
                 temp_path = tf.name
-                yaml.dump({svc: svc_data}, tf, sort_keys=False, allow_unicode=True)
-            # --- add hash before edit
-            with open(temp_path, 'rb') as f:
-                before_hash = hashlib.sha256(f.read()).hexdigest()
+                tf.write(before_bytes)
             # Select Editor
-            editors = CONFIG.get_config_as_list('editor', 'names') or [r'c:\msys64\usr\bin\nano.exe', 'nvim', 'vim']
-            for editor in editors:
-                if shutil.which(editor):
-                    try:
-                        # subprocess.run([editor, temp_path], check=True)
-                        safe_subprocess_run([editor, temp_path])
-                        break
-                    except subprocess.CalledProcessError as e:
-                        console.print(f"❌ [red]Error launching {editor}:[/] {e}")
-                        continue
-                    except Exception as e:
-                        console.print(f"❌ [red]Unexpected error launching {editor}:[/] {e}")
-                        continue
-            else:
+            if not cls._launch_editor(temp_path):
                 console.print("⚠️ [white on red]No suitable editor found to edit the service section.[/]")
                 os.unlink(temp_path)
                 return
@@ -2172,19 +2553,19 @@ class DDF:
             try:
                 with open(temp_path, 'rb') as tf:
                     after_bytes = tf.read()
-                    after_hash = hashlib.sha256(after_bytes).hexdigest()
-                    tf.seek(0)
-                    edited = yaml.safe_load(after_bytes.decode())
-                if before_hash == after_hash:
+                if after_bytes == before_bytes:
                     is_changed = False
                     console.print(f"ℹ️ [yellow]No changes made to service '{svc}'.[/]")
                     os.unlink(temp_path)
                     continue
+                # the loader takes the bytes as they are, no decoded copy of the file
+                edited = yaml.load(after_bytes, Loader=YAML_LOADER)
                 if not edited or svc not in edited:
                     console.print(f"❌ [red]No valid service section found after editing. Skipped update for[/] [bold #FFFF00]'{svc}'.[/]")
                     os.unlink(temp_path)
                     continue
                 content['services'][svc] = edited[svc]
+                updated.append(svc)
                 os.unlink(temp_path)
             except Exception as e:
                 console.print(f"❌ [red]Error reading edited service section:[/] {e}")
@@ -2196,8 +2577,9 @@ class DDF:
             # Backup before saving
             backup_path = BackupManager.create_backup(file_path, operation_type="edit")
             try:
-                with open(file_path, 'w') as f:
-                    yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+                # splice only the edited block(s) back in, rewrite the whole file if that is not possible
+                if not all(cls._write_service_block(file_path, svc, content['services'][svc], exists=True) for svc in updated):
+                    cls._write_yaml(file_path, content)
                 console.print(f"✅ [bold green]Service section(s) updated successfully in {file_path}[/bold green]")
             except Exception as e:
                 console.print(f"❌ [red]Error saving YAML file:[/] {e}")
@@ -2210,6 +2592,17 @@ class DDF:
                 else:
                     console.print("⚠️ [red]No backup available to restore.[/]")
     
+    @classmethod
+    def _find_copy_line(cls, dockerfile_path, filename):
+        """
+        Return the first COPY line of the Dockerfile that mentions filename, or None.
+        """
+        # one regex search over the whole text instead of strip()ing and testing every line
+        # only the keyword is case-insensitive, filenames are matched exactly
+        pattern = re.compile(r'^[ \t]*(?i:COPY)\b[^\n]*' + re.escape(filename) + r'[^\n]*', re.M)
+        m = pattern.search(_read_text(dockerfile_path))
+        return m.group(0).strip() if m else None
+
     @classmethod
     def edit_file(cls, filename, service_name):
         """
@@ -2225,28 +2618,23 @@ class DDF:
             return
 
         # Cari baris COPY yang mengandung filename
-        copy_line = None
-        with open(dockerfile_path, 'r') as f:
-            for line in f:
-                if line.strip().startswith('COPY') and filename in line:
-                    copy_line = line.strip()
-                    break
+        copy_line = cls._find_copy_line(dockerfile_path, filename)
 
         if not copy_line:
             console.print(f"\n❌ [yellow]No COPY line containing '{filename}' found in Dockerfile for '{service_name}'.[/]")
             return
 
         # Ambil path sumber dari COPY
-        parts = copy_line.split()
-        if len(parts) < 3:
+        m = _COPY_RE.match(copy_line)
+        if not m:
             console.print(f"\n❌ [yellow]Malformed COPY line: {copy_line}[/]")
             return
-        src_path = parts[1]
+        src_path = m.group(1)
         # Hilangkan './' jika ada
         if src_path.startswith('./'):
             src_path = src_path[2:]
         # Resolve path relatif terhadap build context
-        compose_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        compose_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         base_dir = os.path.dirname(os.path.abspath(compose_file))
         content = cls.open_file(compose_file)
         services = content.get('services', {})
@@ -2258,30 +2646,27 @@ class DDF:
             console.print(f"\n❌ [yellow]File to edit not found: {file_path}[/]")
             return
 
-        # Hash sebelum edit
+        # Simpan stat dan isi sebelum edit
+        before_stat = os.stat(file_path)
         with open(file_path, 'rb') as f:
-            before_hash = hashlib.sha256(f.read()).hexdigest()
+            before_bytes = f.read()
 
         # Pilih editor
-        editors = CONFIG.get_config_as_list('editor', 'names') or [r'c:\msys64\usr\bin\nano.exe', 'nvim', 'vim']
-        for editor in editors:
-            if shutil.which(editor):
-                try:
-                    # subprocess.run([editor, file_path], check=True)
-                    safe_subprocess_run([editor, file_path])
-                    break
-                except subprocess.CalledProcessError as e:
-                    console.print(f"❌ [red]Error launching {editor}:[/] {e}")
-                    continue
-        else:
+        if not cls._launch_editor(file_path):
             console.print("\n❌ [white on red]No suitable editor found to edit the file.[/]")
             return
 
-        # Hash setelah edit
-        with open(file_path, 'rb') as f:
-            after_hash = hashlib.sha256(f.read()).hexdigest()
+        # same mtime and size means untouched, a new size means changed, only a same-size save needs a compare
+        after_stat = os.stat(file_path)
+        if (after_stat.st_mtime_ns, after_stat.st_size) == (before_stat.st_mtime_ns, before_stat.st_size):
+            changed = False
+        elif after_stat.st_size != before_stat.st_size:
+            changed = True
+        else:
+            with open(file_path, 'rb') as f:
+                changed = f.read() != before_bytes
 
-        if before_hash == after_hash:
+        if not changed:
             console.print(f"ℹ️ [yellow]No changes made to file '{file_path}'.[/]")
         else:
             console.print(f"✅ [green]File '{file_path}' edited successfully.[/]")
@@ -2298,27 +2683,22 @@ class DDF:
             return
 
         # Find COPY line containing filename
-        copy_line = None
-        with open(dockerfile_path, 'r') as f:
-            for line in f:
-                if line.strip().startswith('COPY') and filename in line:
-                    copy_line = line.strip()
-                    break
+        copy_line = cls._find_copy_line(dockerfile_path, filename)
 
         if not copy_line:
             console.print(f"\n❌ [yellow]No COPY line containing '{filename}' found in Dockerfile for '{service_name}'.[/]")
             return
 
         # Get source path from COPY
-        parts = copy_line.split()
-        if len(parts) < 3:
+        m = _COPY_RE.match(copy_line)
+        if not m:
             console.print(f"\n❌ [yellow]Malformed COPY line: {copy_line}[/]")
             return
-        src_path = parts[1]
+        src_path = m.group(1)
         if src_path.startswith('./'):
             src_path = src_path[2:]
         # Resolve path relative to build context
-        compose_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        compose_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         base_dir = os.path.dirname(os.path.abspath(compose_file))
         content = cls.open_file(compose_file)
         services = content.get('services', {})
@@ -2331,36 +2711,23 @@ class DDF:
             return
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                file_content = f.read()
+            file_content = _read_text(file_path)
             # Guess syntax from extension
             ext = os.path.splitext(file_path)[1].lower()
-            syntax_map = {
-                '.sh': 'bash',
-                '.py': 'python',
-                '.yml': 'yaml',
-                '.yaml': 'yaml',
-                '.conf': 'ini',
-                '.json': 'json',
-                '.js': 'javascript',
-                '.ts': 'typescript',
-                '.env': 'bash',
-                '.txt': 'text',
-                '.ini': 'ini',
-                '.md': 'markdown',
-                '.Dockerfile': 'dockerfile',
-                'dockerfile': 'dockerfile',
-            }
-            syntax_name = syntax_map.get(ext, None)
-            if not syntax_name and 'dockerfile' in file_path.lower():
-                syntax_name = 'dockerfile'
-            if syntax_name:
+            syntax_name = cls.SYNTAX_MAP.get(ext, None)
+            if not syntax_name:
+                # Dockerfile, Dockerfile.dev, ... but not any file that merely sits under a "dockerfiles" directory
+                base = os.path.basename(file_path).lower()
+                if base == 'dockerfile' or base.startswith('dockerfile.'):
+                    syntax_name = 'dockerfile'
+            # highlighting is lost when the output is piped, so don't spend the Pygments lexing on it
+            if syntax_name and console.is_terminal:
                 syntax = Syntax(file_content, syntax_name, theme="fruity", line_numbers=line_numbers, word_wrap=True)
                 console.print(f"\n[bold cyan]File:[/] [#FFFF00]{file_path}[/]\n")
                 console.print(syntax)
             else:
                 console.print(f"\n[bold cyan]File:[/] [#FFFF00]{file_path}[/]\n")
-                console.print(file_content)
+                console.out(file_content, highlight=False)
         except Exception as e:
             console.print(f"\n❌ [red]Error reading file:[/] {e}")
             
@@ -2370,15 +2737,15 @@ class DDF:
         Set the Dockerfile path for a given service in the docker-compose.yml.
         If the service does not exist, it will be created.
         """
-        file_path = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        file_path = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(file_path):
             console.print(f"\n❌ [white on red]YAML file not found:[/] {file_path}")
             return
         
         # Load YAML
         try:
-            with open(file_path, 'r') as f:
-                content = yaml.safe_load(f)
+            with open(file_path, 'rb') as f:
+                content = yaml.load(f, Loader=YAML_LOADER)
         except Exception as e:
             console.print(f"\n❌ [red]Error loading YAML:[/] {e}")
             return
@@ -2402,8 +2769,7 @@ class DDF:
 
         # Save back to the original file
         try:
-            with open(file_path, 'w') as f:
-                yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+            cls._write_yaml(file_path, content)
             console.print(f"\n✅ [bold green]Dockerfile path set successfully for service '{service_name}' in {file_path}[/bold green]")
         except Exception as e:
             console.print(f"\n❌ [red]Error writing YAML file:[/] {e}")
@@ -2416,7 +2782,7 @@ class DDF:
         If service_config is provided, it will be used as the initial configuration.
         After creation, open the new service in the editor for user to fill in.
         """
-        file_path = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        file_path = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(file_path):
             console.print(f"\n❌ [white on red]YAML file not found:[/] {file_path}")
             return
@@ -2440,8 +2806,7 @@ class DDF:
 
         # Save back to the file
         try:
-            with open(file_path, 'w') as f:
-                yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+            cls._write_yaml(file_path, content)
             console.print(f"\n✅ [bold green]New service '{service_name}' created successfully in {file_path}[/bold green]")
         except Exception as e:
             console.print(f"\n❌ [red]Error writing YAML file:[/] {e}")
@@ -2457,7 +2822,7 @@ class DDF:
         The service section will be formatted as YAML and copied.
         """
 
-        file_path = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        file_path = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(file_path):
             console.print(f"\n❌ [white on red]YAML file not found:[/] {file_path}")
             return
@@ -2475,10 +2840,10 @@ class DDF:
 
         # Get the service section
         service_section = {service_name: services[service_name]}
-        yaml_str = yaml.dump(service_section, sort_keys=False, allow_unicode=True)
+        yaml_str = yaml.dump(service_section, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
 
         # Copy to clipboard
-        clipboard.copy(yaml_str)
+        lazy_import('clipboard').copy(yaml_str)
         console.print(f"\n✅ [bold green]Service '{service_name}' copied to clipboard successfully.[/]")
     
     @classmethod
@@ -2487,7 +2852,7 @@ class DDF:
         Rename a service section in the YAML file.
         If the new service name already exists, it will not overwrite it.
         """
-        file_path = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        file_path = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(file_path):
             console.print(f"\n❌ [white on red]YAML file not found:[/] {file_path}")
             return
@@ -2512,8 +2877,7 @@ class DDF:
 
         # Save back to the file
         try:
-            with open(file_path, 'w') as f:
-                yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+            cls._write_yaml(file_path, content)
             console.print(f"\n✅ [bold green]Service '{old_service_name}' renamed to '{new_service_name}' successfully in {file_path}[/bold green]")
         except Exception as e:
             console.print(f"\n❌ [red]Error writing YAML file:[/] {e}")
@@ -2536,7 +2900,7 @@ class DDF:
         try:
             with open(dockerfile_path, 'r') as f:
                 content = f.read()
-            clipboard.copy(content)
+            lazy_import('clipboard').copy(content)
             console.print(f"\n✅ [#FFFF00]Dockerfile content for service[/] [#00FFFF]'{service_name}'[/] [#FFFF00]copied to clipboard successfully.[/]")
         except Exception as e:
             console.print(f"\n❌ [red]Error reading Dockerfile:[/] [white on red]{e}[/]")
@@ -2570,7 +2934,7 @@ class DDF:
             return None
 
         # compose file
-        compose_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        compose_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(compose_file):
             console.print(f"\n❌ [red]docker-compose file not found:[/] {compose_file}")
             return None
@@ -2593,7 +2957,7 @@ class DDF:
         dockerfile_name_cfg = build_cfg.get('dockerfile', 'Dockerfile')
 
         # determine base dir for relative contexts
-        root_path = CONFIG.get_config('docker-compose', 'root_path')
+        root_path = _config('docker-compose', 'root_path')
         if root_path and os.path.isdir(root_path):
             base_dir = root_path
         else:
@@ -2656,8 +3020,7 @@ class DDF:
             BackupManager.create_backup(compose_file)#, operation_type="update-dockerfile")
 
             # write
-            with open(compose_file, 'w', encoding='utf-8') as f:
-                yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+            cls._write_yaml(compose_file, content)
             console.print(f"✅ [green]Updated compose: set services.{to_svc_name}.build.dockerfile -> {dockerfile_value} in {compose_file}")
         except Exception as e:
             console.print(f"\n❌ [red]Failed to update compose file:[/] {e}")
@@ -2671,19 +3034,17 @@ class DDF:
         """
         
         def duplicating(service_name, services, file_path):
-            # Duplicate the service
-            services[new_service_name] = services[service_name]
-            content['services'] = services
-    
-            # Save back to the file
+            # Save back to the file, appending only the new block when possible
             try:
-                with open(file_path, 'w') as f:
-                    yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+                if not cls._write_service_block(file_path, new_service_name, services[service_name], exists=new_service_name in services):
+                    services[new_service_name] = copy.deepcopy(services[service_name])
+                    content['services'] = services
+                    cls._write_yaml(file_path, content)
                 console.print(f"\n✅ [bold green]Service '{service_name}' duplicated to '{new_service_name}' successfully in {file_path}[/bold green]")
             except Exception as e:
                 console.print(f"\n❌ [red]Error writing YAML file:[/] {e}")
         
-        file_path = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        file_path = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(file_path):
             console.print(f"\n❌ [white on red]YAML file not found:[/] {file_path}")
             return
@@ -2718,7 +3079,7 @@ class DDF:
         """
         Remove a service section from the YAML file.
         """
-        file_path = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        file_path = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         if not os.path.isfile(file_path):
             console.print(f"\n❌ [white on red]YAML file not found:[/] {file_path}")
             return
@@ -2740,8 +3101,7 @@ class DDF:
 
         # Save back to the file
         try:
-            with open(file_path, 'w') as f:
-                yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+            cls._write_yaml(file_path, content)
             console.print(f"\n ⚠️ [bold green]Service '{service_name}' removed successfully from {file_path}[/bold green]")
         except Exception as e:
             console.print(f"\n ❌ [red]Error writing YAML file:[/] {e}")
@@ -2788,7 +3148,7 @@ class DDF:
     
     @classmethod
     def usage(cls):
-        default_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        default_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
 
         parser = argparse.ArgumentParser(description="Detect or list ports in a Docker Compose file.", formatter_class=CustomRichHelpFormatter)
         parser.add_argument('service', nargs='?', help="Service name to inspect")
@@ -3028,6 +3388,16 @@ class EditorManager:
         'subl': 'sublime_wait',
         'sublime_text': 'sublime_wait'
     }
+
+    @classmethod
+    def _get_editors(cls):
+        """Return the configured editors that are installed, re-read and resolved on PATH only when ddf.ini changes."""
+        def compute():
+            names = CONFIG.get_config_as_list('editor', 'names') or [
+                r'c:\msys64\usr\bin\nano.exe', 'nvim', 'vim', 'subl', 'code'
+            ]
+            return [editor for editor in names if shutil.which(editor)]
+        return _config_memo(('EditorManager', 'editors'), compute)
     
     @classmethod
     def edit_file_with_monitoring(cls, file_path, callback_on_save=None, timeout=300, detached=False):
@@ -3050,12 +3420,8 @@ class EditorManager:
             console.print(f"[dim]Debug: timeout={timeout}[/]")
         
 
-        editors = CONFIG.get_config_as_list('editor', 'names') or [
-            r'c:\msys64\usr\bin\nano.exe', 'nvim', 'vim', 'subl', 'code'
-        ]
-
         if debug_mode:
-            console.print(f"[dim]Debug: editors={editors}[/]")
+            console.print(f"[dim]Debug: editors={cls._get_editors()}[/]")
     
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         file_path = Path(file_path).resolve()
@@ -3064,46 +3430,45 @@ class EditorManager:
         if debug_mode:
             console.print(f"[dim]Debug: original_hash={original_hash}[/]")
 
-        for editor in editors:
-            if shutil.which(editor):
-                editor_type = cls.get_editor_type(editor)
-                
-                if debug_mode:
-                    console.print(f"[dim]Debug: trying editor={editor}, type={editor_type}[/]")
+        for editor in cls._get_editors():
+            editor_type = cls.get_editor_type(editor)
             
-                try:
-                    # DETACHED MODE for blocking editors
-                    if detached and editor_type == 'blocking':
-                        return cls._edit_with_detached_terminal(
-                            editor, file_path, callback_on_save, original_hash
-                        )
+            if debug_mode:
+                console.print(f"[dim]Debug: trying editor={editor}, type={editor_type}[/]")
+            
+            try:
+                # DETACHED MODE for blocking editors
+                if detached and editor_type == 'blocking':
+                    return cls._edit_with_detached_terminal(
+                        editor, file_path, callback_on_save, original_hash
+                    )
+                
+                # Normal mode
+                if editor_type == 'blocking':
+                    result = safe_subprocess_run([editor, str(file_path)])
+                    if callback_on_save:
+                        new_hash = cls._get_file_hash(file_path)
+                        if new_hash != original_hash:
+                            callback_on_save(file_path, changed=True)
+                        else:
+                            callback_on_save(file_path, changed=False)
+                    return True
+                elif editor_type == 'sublime_wait':
+                    return cls._edit_with_sublime_wait(
+                        editor, file_path, callback_on_save, original_hash
+                    )
+                else:
+                    # return cls._edit_with_file_monitoring(
+                    return cls.edit_file_with_monitoring(
+                        editor, file_path, callback_on_save, timeout, original_hash
+                    )
                     
-                    # Normal mode
-                    if editor_type == 'blocking':
-                        result = safe_subprocess_run([editor, str(file_path)])
-                        if callback_on_save:
-                            new_hash = cls._get_file_hash(file_path)
-                            if new_hash != original_hash:
-                                callback_on_save(file_path, changed=True)
-                            else:
-                                callback_on_save(file_path, changed=False)
-                        return True
-                    elif editor_type == 'sublime_wait':
-                        return cls._edit_with_sublime_wait(
-                            editor, file_path, callback_on_save, original_hash
-                        )
-                    else:
-                        # return cls._edit_with_file_monitoring(
-                        return cls.edit_file_with_monitoring(
-                            editor, file_path, callback_on_save, timeout, original_hash
-                        )
-                        
-                except subprocess.CalledProcessError as e:
-                    console.print(f"❌ [red]Error launching {editor}:[/] {e}")
-                    continue
-                except Exception as e:
-                    console.print(f"❌ [red]Unexpected error with {editor}:[/] {e}")
-                    continue
+            except subprocess.CalledProcessError as e:
+                console.print(f"❌ [red]Error launching {editor}:[/] {e}")
+                continue
+            except Exception as e:
+                console.print(f"❌ [red]Unexpected error with {editor}:[/] {e}")
+                continue
         
         console.print("❌ [red]No suitable editor found.[/]")
         return False
@@ -3116,6 +3481,7 @@ class EditorManager:
     def _edit_with_detached_terminal(cls, editor, file_path, callback, original_hash):
         """Open editor in new terminal window and monitor file changes."""
         import platform
+        import shlex
         
         system = platform.system()
         console.print(f"🔧 [cyan]Opening {editor} in new terminal window...[/]")
@@ -3458,7 +3824,7 @@ class EditorManager:
     
     @staticmethod
     def _get_file_hash(file_path, retry=3, delay=0.1):
-        """Get SHA256 hash of file content with retry logic."""
+        """Get a BLAKE2b hash of file content with retry logic."""
         for attempt in range(retry):
             try:
                 if not file_path.exists():
@@ -3469,8 +3835,16 @@ class EditorManager:
                     time.sleep(delay)
                 
                 with open(file_path, 'rb') as f:
-                    content = f.read()
-                    return hashlib.sha256(content).hexdigest()
+                    # stream through a fixed buffer instead of holding the whole file in memory,
+                    # the hash only detects edits so blake2b is used, it is much faster than sha256
+                    if hasattr(hashlib, 'file_digest'):
+                        return hashlib.file_digest(f, 'blake2b').hexdigest()
+                    h = hashlib.blake2b()
+                    buf = bytearray(65536)
+                    view = memoryview(buf)
+                    while n := f.readinto(buf):
+                        h.update(view[:n])
+                    return h.hexdigest()
                     
             except (IOError, PermissionError) as e:
                 # File might be locked by editor
@@ -3517,7 +3891,7 @@ class EnhancedDDF(DDF):
     @classmethod
     def edit_service_enhanced(cls, file_path=None, service_name=None, detached=False):
         """Enhanced edit_service with better backup and monitoring."""
-        file_path = file_path or CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        file_path = file_path or _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         
         if not service_name:
             console.print("❌ [red]No service name provided for editing.[/]")
@@ -3546,8 +3920,8 @@ class EnhancedDDF(DDF):
 
         # Load and prepare service data
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = yaml.safe_load(f)
+            with open(file_path, 'rb') as f:
+                content = yaml.load(f, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
             console.print(f"❌ [red]YAML syntax error in {file_path}:[/]")
             console.print(f"    {e}")
@@ -3557,7 +3931,8 @@ class EnhancedDDF(DDF):
             return
 
         services = content.get('services', {})
-        matched = [svc for svc in services if fnmatch.fnmatch(svc, service_name) or service_name in svc]
+        match = _compile_glob(service_name)
+        matched = [svc for svc in services if match(svc)]
         
         if not matched:
             console.print(f"❌ [yellow]Service pattern '{service_name}' not found.[/]")
@@ -3587,7 +3962,7 @@ class EnhancedDDF(DDF):
             # Create temporary file
             with tempfile.NamedTemporaryFile('w+', delete=False, suffix='.yml') as tf:
                 temp_path = Path(tf.name)
-                yaml.dump({svc: svc_data}, tf, sort_keys=False, allow_unicode=True)
+                yaml.dump({svc: svc_data}, tf, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
 
             # def on_save_callback(changed_path, changed=False):
             #     if changed:
@@ -3626,15 +4001,14 @@ class EnhancedDDF(DDF):
                         # Give file system time to sync
                         time.sleep(0.5)
                         
-                        with open(changed_path, 'r') as f:
-                            edited = yaml.safe_load(f)
+                        with open(changed_path, 'rb') as f:
+                            edited = yaml.load(f, Loader=YAML_LOADER)
                         
                         if edited and svc in edited:
                             content['services'][svc] = edited[svc]
                             
                             # Save main file
-                            with open(file_path, 'w') as f:
-                                yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+                            cls._write_yaml(file_path, content)
                             
                             console.print(f"✅ [green]Service '{svc}' updated successfully![/]")
                             
@@ -3749,7 +4123,7 @@ class EnhancedDDF(DDF):
     @classmethod
     def remove_service_enhanced(cls, service_name):
         """Enhanced remove_service with backup."""
-        file_path = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        file_path = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         
         # Create backup before removal
         backup_path = EnhancedBackupManager.create_backup_with_context(
@@ -3773,7 +4147,7 @@ class Usage(EnhancedDDF):
 
     @classmethod
     def usage(cls):
-        default_file = CONFIG.get_config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
+        default_file = _config('docker-compose', 'file') or r"c:\PROJECTS\docker-compose.yml"
         
         parser = argparse.ArgumentParser(description="Detect or list ports in a Docker Compose file.", formatter_class=CustomRichHelpFormatter)
         parser.add_argument('service', nargs='?', help="Service name to inspect")
@@ -3901,115 +4275,86 @@ class Usage(EnhancedDDF):
                     return
         # =======================================================
 
-        if not os.path.isfile(args.file):
-            console.print(f"\n❌ [white on red]YAML file not found:[/] {args.file}")
-            sys.exit(1)
-
         try:
-            content = cls.open_file(args.file)
-        except Exception as e:
-            console.print(f"\n❌ [red]Error:[/] {e}")
-            if str(os.getenv('TRACEBACK', '0')).lower() in ['1', 'yes', 'true']:
-                console.print_exception()            
+            file_stat = os.stat(args.file)
+        except (OSError, ValueError):
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            console.print(f"\n❌ [white on red]YAML file not found:[/] {args.file}")
             sys.exit(1)
 
         if args.theme:
             # console.set_theme(args.theme)
             cls.THEME = args.theme
-        if args.device:
-            cls.list_service_devices(content, args.service)
-        if args.volumes:
-            cls.list_service_volumes(content, args.service)
-        if args.VOLUMES:
-            DDF.list_volumes(content, args.service)
-        if args.list_port:
-            if args.service:
-                cls.list_service_ports(content, args.service)
-            else:
-                console.print("\n❌ [white on red]No service specified for listing ports.[/]")
-                sys.exit(1)
-        if args.hostname:
-            cls.list_hostnames(content, args.service)
-        if args.port:
-            cls.check_duplicate_port(content, args.port)
-        if args.find or (args.service and args.service.isdigit()):
-            cls.find_port(content, args.find or args.service, compact=False if args.all else True)
-        if args.service and args.detail:
-            cls.show_service_detail(content, args.service, args.no_line_numbers)
-        if args.service and args.list:
-            cls.list_service_ports(content, args.service)
-        if args.service and args.dockerfile:
-            cls.read_dockerfile(service_name=args.service, line_numbers=args.no_line_numbers)
-        if args.service and args.entrypoint:
-            cls.read_entrypoint(service_name=args.service, line_numbers=args.no_line_numbers)
-        if args.service and args.edit_entrypoint:
-            # cls.edit_entrypoint(service_name=args.service)
-            cls.edit_entrypoint_enhanced(service_name=args.service, detached=ars.detach)
-        if args.service and args.remove_service:
-            # cls.remove_service(args.service)
-            cls.remove_service_enhanced(args.service)
-        if args.service and args.edit_dockerfile:
-            # cls.edit_dockerfile(service_name=args.service)
-            cls.edit_dockerfile_enhanced(service_name=args.service, detached=ars.detach)
-        if args.service and args.set_dockerfile:
-            if not args.set_dockerfile:
-                console.print("\n❌ [white on red]No Dockerfile path provided for setting.[/]")
+
+        service = args.service
+
+        def need_service(message):
+            if not service:
+                console.print(f"\n❌ [white on red]{message}[/]")
                 sys.exit(1)
-            cls.set_dockerfile(args.service, args.set_dockerfile)
+            return service
+
+        def set_dockerfile(content):
+            cls.set_dockerfile(service, args.set_dockerfile)
             if args.edit_dockerfile:
                 # cls.edit_dockerfile(service_name=args.service)
-                cls.edit_dockerfile_enhanced(service_name=args.service)
+                cls.edit_dockerfile_enhanced(service_name=service)
             elif args.edit_service:
                 # cls.edit_service(file_path=args.file, service_name=args.service)
-                cls.edit_service_enhanced(file_path=args.file, service_name=args.service)
+                cls.edit_service_enhanced(file_path=args.file, service_name=service)
             elif args.dockerfile:
-                cls.read_dockerfile(service_name=args.service, line_numbers=args.no_line_numbers)
-        if args.service and args.edit_file:
-            if not args.edit_file:
-                console.print("\n❌ [white on red]No filename provided for editing.[/]")
-                sys.exit(1)
-            cls.edit_file(args.edit_file, args.service)
-        if args.service and args.read_file:
-            if not args.read_file:
-                console.print("\n❌ [white on red]No filename provided for reading.[/]")
-                sys.exit(1)
-            cls.read_file(args.read_file, args.service, line_numbers=args.no_line_numbers)
-        if args.list_service_name:
-            cls.list_service_names(content, args.filter)
-        if args.service and args.edit_service:
-            # cls.edit_service(file_path=args.file, service_name=args.service)
-            cls.edit_service_enhanced(file_path=args.file, service_name=args.service)
-        if args.new:
-            if not args.service:
-                console.print("\n❌ [white on red]No service name provided for new service.[/]")
-                sys.exit(1)
-            cls.new_service(args.service)
-        if args.service and args.copy_service:
-            if not args.service:
-                console.print("\n❌ [white on red]No service name provided for copying.[/]")
-                sys.exit(1)
-            cls.copy_service(args.service)
-        elif args.copy_dockerfile:
-            if not args.service:
-                console.print("\n❌ [white on red]No service name provided for copying Dockerfile.[/]")
-                sys.exit(1)
-            cls.copy_dockerfile(args.service)
-        elif args.rename_service:
-            if not args.service:
-                console.print("\n❌ [white on red]No service name provided for copying Dockerfile.[/]")
-                sys.exit(1)
-            cls.rename_service(args.service, args.rename_service)
-        if args.duplicate_service:
-            if not args.service:
-                console.print("\n❌ [white on red]No service name provided for duplication.[/]")
-                sys.exit(1)
-            cls.duplicate_server(args.service, args.duplicate_service)
+                cls.read_dockerfile(service_name=service, line_numbers=args.no_line_numbers)
+
+        copy_selected = bool(service and args.copy_service)
+        # (selected, needs parsed content, action) in execution order, every selected action runs
+        actions = (
+            (args.device, True, lambda content: cls.list_service_devices(content, service)),
+            (args.volumes, True, lambda content: cls.list_service_volumes(content, service)),
+            (args.VOLUMES, True, lambda content: DDF.list_volumes(content, service)),
+            (args.list_port, True, lambda content: cls.list_service_ports(content, need_service("No service specified for listing ports."))),
+            (args.hostname, True, lambda content: cls.list_hostnames(content, service)),
+            (args.port, True, lambda content: cls.check_duplicate_port(content, args.port)),
+            (args.find or (service and service.isdigit()), True, lambda content: cls.find_port(content, args.find or service, compact=False if args.all else True)),
+            (service and args.detail, True, lambda content: cls.show_service_detail(content, service, args.no_line_numbers)),
+            (service and args.list, True, lambda content: cls.list_service_ports(content, service)),
+            (service and args.dockerfile, False, lambda content: cls.read_dockerfile(service_name=service, line_numbers=args.no_line_numbers)),
+            (service and args.entrypoint, False, lambda content: cls.read_entrypoint(service_name=service, line_numbers=args.no_line_numbers)),
+            (service and args.edit_entrypoint, False, lambda content: cls.edit_entrypoint_enhanced(service_name=service, detached=args.detach)),
+            (service and args.remove_service, False, lambda content: cls.remove_service_enhanced(service)),
+            (service and args.edit_dockerfile, False, lambda content: cls.edit_dockerfile_enhanced(service_name=service, detached=args.detach)),
+            (service and args.set_dockerfile, False, set_dockerfile),
+            (service and args.edit_file, False, lambda content: cls.edit_file(args.edit_file, service)),
+            (service and args.read_file, False, lambda content: cls.read_file(args.read_file, service, line_numbers=args.no_line_numbers)),
+            (args.list_service_name, True, lambda content: cls.list_service_names(content, args.filter)),
+            (service and args.edit_service, False, lambda content: cls.edit_service_enhanced(file_path=args.file, service_name=service)),
+            (args.new, False, lambda content: cls.new_service(need_service("No service name provided for new service."))),
+            (copy_selected, False, lambda content: cls.copy_service(service)),
+            (not copy_selected and args.copy_dockerfile, False, lambda content: cls.copy_dockerfile(need_service("No service name provided for copying Dockerfile."))),
+            (not copy_selected and not args.copy_dockerfile and args.rename_service, False, lambda content: cls.rename_service(need_service("No service name provided for copying Dockerfile."), args.rename_service)),
+            (args.duplicate_service, False, lambda content: cls.duplicate_server(need_service("No service name provided for duplication."), args.duplicate_service)),
+        )
         #if only service is provided, check for duplicate ports
-        debug(_option_string_actions = parser.__dict__.get('_option_string_actions').keys())
-        debug(len_filter__option_string_actions = len(list(filter(lambda k: k in parser.__dict__.get('_option_string_actions').keys(), [i for i in sys.argv[1:]]))))
-        # if args.service and not (args.list or args.detail or args.dockerfile or args.entrypoint or args.edit_dockerfile or args.edit_entrypoint or args.set_dockerfile or args.edit_service or args.remove_service or args.copy_service or args.copy_dockerfile or args.duplicate_service):
-        if len(list(filter(lambda k: k in parser.__dict__.get('_option_string_actions').keys(), [i for i in sys.argv[1:]]))) == 0 and args.service:
-            cls.find_duplicate_port(content, target_service=args.service)
+        option_strings = parser._option_string_actions
+        check_duplicates = bool(service) and not any(arg in option_strings for arg in sys.argv[1:])
+
+        # commands that read or edit files on their own never touch the parsed YAML, skip parsing for them
+        content = None
+        if check_duplicates or any(selected and needs_content for selected, needs_content, _ in actions):
+            try:
+                content = cls.open_file(args.file, st=file_stat)
+            except Exception as e:
+                console.print(f"\n❌ [red]Error:[/] {e}")
+                if str(os.getenv('TRACEBACK', '0')).lower() in ['1', 'yes', 'true']:
+                    console.print_exception()            
+                sys.exit(1)
+
+        for selected, _, action in actions:
+            if selected:
+                action(content)
+
+        if check_duplicates:
+            cls.find_duplicate_port(content, target_service=service)
 
 
 if __name__ == '__main__':
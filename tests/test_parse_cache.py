@@ -0,0 +1,57 @@
+import socket
+
+import pytest
+
+from ddf import DDF, CACHE, CACHE_CONFIG, CacheBackend
+
+
+COMPOSE = """\
+services:
+  web:
+    image: nginx
+"""
+
+
+def unused_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def unreachable_redis(tmp_path, monkeypatch):
+    shared = tmp_path / 'shared'
+    monkeypatch.setattr(CACHE_CONFIG, 'enabled', True)
+    monkeypatch.setattr(CACHE_CONFIG, 'backend', CacheBackend.REDIS)
+    monkeypatch.setattr(CACHE_CONFIG, 'redis_host', '127.0.0.1')
+    monkeypatch.setattr(CACHE_CONFIG, 'redis_port', unused_port())
+    monkeypatch.setattr(CACHE_CONFIG, 'pickle_dir', str(shared))
+    monkeypatch.setattr(CACHE, 'backend', CacheBackend.REDIS)
+    monkeypatch.setattr(CACHE, '_clients', {})
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    monkeypatch.setattr(DDF, '_file_cache', type(DDF._file_cache)())
+    return shared
+
+
+def test_redis_fallback_never_pickles_parsed_content(tmp_path, unreachable_redis):
+    path = tmp_path / 'docker-compose.yml'
+    path.write_text(COMPOSE)
+
+    assert DDF.open_file(str(path)) == {'services': {'web': {'image': 'nginx'}}}
+
+    assert CACHE.backend == CacheBackend.PICKLE
+    assert list(unreachable_redis.glob('parsed*')) == []
+    assert len(list((tmp_path / 'xdg' / 'ddf').glob('*.ddfcache'))) == 1
+
+
+def test_sidecar_is_reused_by_the_next_load(tmp_path, unreachable_redis, monkeypatch):
+    path = tmp_path / 'docker-compose.yml'
+    path.write_text(COMPOSE)
+    DDF.open_file(str(path))
+    DDF._file_cache.clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed again")
+    monkeypatch.setattr(DDF, '_load_file', fail)
+
+    assert DDF.open_file(str(path)) == {'services': {'web': {'image': 'nginx'}}}
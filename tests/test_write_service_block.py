@@ -0,0 +1,156 @@
+import hashlib
+
+import pytest
+import yaml
+
+from ddf import DDF, CACHE_CONFIG
+
+
+COMPOSE = """\
+# project compose file
+version: '3.8'
+
+services:
+  web:
+    image: nginx
+    ports:
+      - "80:80"
+
+  # the database
+  db:
+    image: postgres
+
+volumes:
+  data: {}
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(CACHE_CONFIG, 'enabled', False)
+
+
+@pytest.fixture
+def compose(tmp_path):
+    def make(text, newline='\n'):
+        path = tmp_path / 'docker-compose.yml'
+        path.write_bytes(text.replace('\n', newline).encode('utf-8'))
+        return path
+    return make
+
+
+def test_replace_keeps_rest_of_file(compose):
+    path = compose(COMPOSE)
+    assert DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+    text = path.read_text()
+    assert text == COMPOSE.replace('    image: nginx\n    ports:\n      - "80:80"\n', '    image: httpd\n')
+    assert yaml.safe_load(text)['services'] == {'web': {'image': 'httpd'}, 'db': {'image': 'postgres'}}
+
+
+def test_replace_last_service_keeps_gap_before_next_key(compose):
+    path = compose(COMPOSE)
+    assert DDF._write_service_block(str(path), 'db', {'image': 'mysql'}, exists=True)
+    text = path.read_text()
+    assert '  # the database\n  db:\n    image: mysql\n\nvolumes:\n' in text
+
+
+def test_append_new_service(compose):
+    path = compose(COMPOSE)
+    assert DDF._write_service_block(str(path), 'cache', {'image': 'redis'}, exists=False)
+    text = path.read_text()
+    assert '  db:\n    image: postgres\n  cache:\n    image: redis\n\nvolumes:\n' in text
+    assert list(yaml.safe_load(text)['services']) == ['web', 'db', 'cache']
+
+
+def test_append_to_file_without_trailing_newline(compose):
+    path = compose("services:\n  web:\n    image: nginx")
+    assert DDF._write_service_block(str(path), 'db', {'image': 'postgres'}, exists=False)
+    assert path.read_text() == "services:\n  web:\n    image: nginx\n  db:\n    image: postgres\n"
+
+
+def test_crlf_is_preserved(compose):
+    path = compose(COMPOSE, newline='\r\n')
+    assert DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+    data = path.read_bytes()
+    assert b'\n' not in data.replace(b'\r\n', b'')
+    assert b'  web:\r\n    image: httpd\r\n' in data
+
+
+def test_comments_are_kept(compose):
+    path = compose(COMPOSE)
+    assert DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+    text = path.read_text()
+    assert text.startswith('# project compose file\n')
+    assert '  # the database\n' in text
+
+
+@pytest.mark.parametrize('line', ['"web":', "'web':", 'web:  # frontend'])
+def test_quoted_or_commented_key(compose, line):
+    path = compose(COMPOSE.replace('  web:\n', f'  {line}\n'))
+    assert DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+    assert yaml.safe_load(path.read_text())['services']['web'] == {'image': 'httpd'}
+
+
+def test_hash_marker_is_refreshed(compose, tmp_path):
+    path = compose(COMPOSE)
+    algo = CACHE_CONFIG.hash_algo
+    stale = hashlib.new(algo, b'stale').hexdigest()
+    (tmp_path / f"{stale}.{algo}").write_text(stale)
+    (tmp_path / f"release.{algo}").write_text('not ours')
+    assert DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+    expected = hashlib.new(algo, path.read_bytes()).hexdigest()
+    assert sorted(p.name for p in tmp_path.glob(f"*.{algo}")) == sorted([f"{expected}.{algo}", f"release.{algo}"])
+
+
+def test_legacy_sha256_marker_is_removed(compose, tmp_path, monkeypatch):
+    monkeypatch.setattr(CACHE_CONFIG, 'hash_algo', 'blake2b')
+    path = compose(COMPOSE)
+    legacy = hashlib.sha256(b'old').hexdigest()
+    (tmp_path / f"{legacy}.sha256").write_text(legacy)
+    (tmp_path / "release.sha256").write_text('not ours')
+    assert DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+    assert [p.name for p in tmp_path.glob("*.sha256")] == ["release.sha256"]
+
+
+@pytest.mark.parametrize('text', [
+    "version: '3.8'\n",
+    "services: {web: {image: nginx}}\n",
+    "services:\n",
+    "services:\n  web:\n    image: nginx\nservices:\n  db:\n    image: postgres\n",
+], ids=['no-services', 'flow-style', 'empty-services', 'duplicate-services'])
+def test_unrecognised_layout_falls_back(compose, text):
+    path = compose(text)
+    assert not DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+    assert path.read_text() == text
+
+
+@pytest.mark.parametrize('name, exists', [('web', False), ('cache', True)])
+def test_existence_mismatch_falls_back(compose, name, exists):
+    path = compose(COMPOSE)
+    assert not DDF._write_service_block(str(path), name, {'image': 'httpd'}, exists=exists)
+    assert path.read_text() == COMPOSE
+
+
+def test_anchor_in_old_block_falls_back(compose):
+    text = COMPOSE.replace('    image: nginx\n', '    image: nginx\n    environment: &env\n      A: "1"\n')
+    path = compose(text)
+    assert not DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+    assert path.read_text() == text
+
+
+def test_anchor_in_new_block_falls_back(compose):
+    path = compose(COMPOSE)
+    shared = ['a', 'b']
+    value = {'image': 'httpd', 'command': shared, 'entrypoint': shared}
+    assert not DDF._write_service_block(str(path), 'web', value, exists=True)
+    assert path.read_text() == COMPOSE
+
+
+def test_non_utf8_file_falls_back(compose, tmp_path):
+    path = tmp_path / 'docker-compose.yml'
+    path.write_bytes(COMPOSE.encode('utf-16'))
+    assert not DDF._write_service_block(str(path), 'web', {'image': 'httpd'}, exists=True)
+
+
+def test_missing_file_falls_back(tmp_path):
+    assert not DDF._write_service_block(str(tmp_path / 'missing.yml'), 'web', {'image': 'httpd'}, exists=True)